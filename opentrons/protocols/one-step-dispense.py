@@ -19,6 +19,9 @@ def run(protocol: protocol_api.ProtocolContext):
     # Load labware - using custom Greiner 96 well plates
     source_plate = protocol.load_labware('greiner_96_wellplate_200ul', 'D1', 'Source Plate')
     dest_plate = protocol.load_labware('greiner_96_wellplate_200ul', 'D2', 'Destination Plate')
+    # Build the name->well dict once; each step below indexes into it instead
+    # of rebuilding the 96-entry dict per list comprehension.
+    dest_wells = dest_plate.wells_by_name()
     
     # Load tip racks
     tiprack_1 = protocol.load_labware('opentrons_flex_96_filtertiprack_50ul', 'C1')
@@ -63,14 +66,82 @@ def run(protocol: protocol_api.ProtocolContext):
     sulfonyl_12 = protocol.define_liquid(name='SulfonylCl 12', description='SulfonylCl 12', display_color='#33FF00')
     
     # Load liquids into source plate
-    source_plate['A1'].load_liquid(liquid=amine_1, volume=50)
-    source_plate['B1'].load_liquid(liquid=amine_2, volume=50)
-    source_plate['C1'].load_liquid(liquid=amine_3, volume=50)
-    source_plate['D1'].load_liquid(liquid=amine_4, volume=50)
-    source_plate['E1'].load_liquid(liquid=amine_5, volume=50)
-    source_plate['F1'].load_liquid(liquid=amine_6, volume=50)
-    source_plate['G1'].load_liquid(liquid=amine_7, volume=50)
-    source_plate['H1'].load_liquid(liquid=amine_8, volume=50)
+    # Amines are pre-loaded as patterned columns so the 8-channel pipette can
+    # fill a full destination column per aspiration. Destination column c draws
+    # from source column ((c - 1) % 8) + 4; rows A/C/E/G carry one amine of the
+    # column's pair and rows B/D/F/H the other, reproducing the original
+    # combinatorial layout exactly.
+    source_plate['A4'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['B4'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['C4'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['D4'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['E4'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['F4'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['G4'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['H4'].load_liquid(liquid=amine_4, volume=50)
+
+    source_plate['A5'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['B5'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['C5'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['D5'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['E5'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['F5'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['G5'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['H5'].load_liquid(liquid=amine_3, volume=50)
+
+    source_plate['A6'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['B6'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['C6'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['D6'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['E6'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['F6'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['G6'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['H6'].load_liquid(liquid=amine_2, volume=50)
+
+    source_plate['A7'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['B7'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['C7'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['D7'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['E7'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['F7'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['G7'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['H7'].load_liquid(liquid=amine_1, volume=50)
+
+    source_plate['A8'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['B8'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['C8'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['D8'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['E8'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['F8'].load_liquid(liquid=amine_8, volume=50)
+    source_plate['G8'].load_liquid(liquid=amine_4, volume=50)
+    source_plate['H8'].load_liquid(liquid=amine_8, volume=50)
+
+    source_plate['A9'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['B9'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['C9'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['D9'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['E9'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['F9'].load_liquid(liquid=amine_7, volume=50)
+    source_plate['G9'].load_liquid(liquid=amine_3, volume=50)
+    source_plate['H9'].load_liquid(liquid=amine_7, volume=50)
+
+    source_plate['A10'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['B10'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['C10'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['D10'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['E10'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['F10'].load_liquid(liquid=amine_6, volume=50)
+    source_plate['G10'].load_liquid(liquid=amine_2, volume=50)
+    source_plate['H10'].load_liquid(liquid=amine_6, volume=50)
+
+    source_plate['A11'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['B11'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['C11'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['D11'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['E11'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['F11'].load_liquid(liquid=amine_5, volume=50)
+    source_plate['G11'].load_liquid(liquid=amine_1, volume=50)
+    source_plate['H11'].load_liquid(liquid=amine_5, volume=50)
     
     source_plate['A2'].load_liquid(liquid=sulfonyl_1, volume=50)
     source_plate['B2'].load_liquid(liquid=sulfonyl_2, volume=50)
@@ -90,102 +161,99 @@ def run(protocol: protocol_api.ProtocolContext):
     
     # Step 1-12: Transfer SulfonylCl compounds to destination plate
     # Step 1: SulfonylCl 1 to A01-A08
-    sulfonyl_dest_1 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_1 = [dest_wells[well] for well in 
                        ['A1', 'A2', 'A3', 'A4', 'A5', 'A6', 'A7', 'A8']]
-    left_pipette.transfer(transfer_vol, source_plate['A2'], sulfonyl_dest_1, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['A2'], sulfonyl_dest_1, new_tip='once', disposal_volume=2)
     
     # Step 2: SulfonylCl 2 to A09-B04
-    sulfonyl_dest_2 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_2 = [dest_wells[well] for well in 
                        ['A9', 'A10', 'A11', 'A12', 'B1', 'B2', 'B3', 'B4']]
-    left_pipette.transfer(transfer_vol, source_plate['B2'], sulfonyl_dest_2, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['B2'], sulfonyl_dest_2, new_tip='once', disposal_volume=2)
     
     # Step 3: SulfonylCl 3 to B05-B12
-    sulfonyl_dest_3 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_3 = [dest_wells[well] for well in 
                        ['B5', 'B6', 'B7', 'B8', 'B9', 'B10', 'B11', 'B12']]
-    left_pipette.transfer(transfer_vol, source_plate['C2'], sulfonyl_dest_3, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['C2'], sulfonyl_dest_3, new_tip='once', disposal_volume=2)
     
     # Step 4: SulfonylCl 4 to C01-C08
-    sulfonyl_dest_4 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_4 = [dest_wells[well] for well in 
                        ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8']]
-    left_pipette.transfer(transfer_vol, source_plate['D2'], sulfonyl_dest_4, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['D2'], sulfonyl_dest_4, new_tip='once', disposal_volume=2)
     
     # Step 5: SulfonylCl 5 to C09-D04
-    sulfonyl_dest_5 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_5 = [dest_wells[well] for well in 
                        ['C9', 'C10', 'C11', 'C12', 'D1', 'D2', 'D3', 'D4']]
-    left_pipette.transfer(transfer_vol, source_plate['E2'], sulfonyl_dest_5, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['E2'], sulfonyl_dest_5, new_tip='once', disposal_volume=2)
     
     # Step 6: SulfonylCl 6 to D05-D12
-    sulfonyl_dest_6 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_6 = [dest_wells[well] for well in 
                        ['D5', 'D6', 'D7', 'D8', 'D9', 'D10', 'D11', 'D12']]
-    left_pipette.transfer(transfer_vol, source_plate['F2'], sulfonyl_dest_6, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['F2'], sulfonyl_dest_6, new_tip='once', disposal_volume=2)
     
     # Step 7: SulfonylCl 7 to E01-E08
-    sulfonyl_dest_7 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_7 = [dest_wells[well] for well in 
                        ['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7', 'E8']]
-    left_pipette.transfer(transfer_vol, source_plate['G2'], sulfonyl_dest_7, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['G2'], sulfonyl_dest_7, new_tip='once', disposal_volume=2)
     
     # Step 8: SulfonylCl 8 to E09-F04
-    sulfonyl_dest_8 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_8 = [dest_wells[well] for well in 
                        ['E9', 'E10', 'E11', 'E12', 'F1', 'F2', 'F3', 'F4']]
-    left_pipette.transfer(transfer_vol, source_plate['H2'], sulfonyl_dest_8, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['H2'], sulfonyl_dest_8, new_tip='once', disposal_volume=2)
     
     # Step 9: SulfonylCl 9 to F05-F12
-    sulfonyl_dest_9 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_9 = [dest_wells[well] for well in 
                        ['F5', 'F6', 'F7', 'F8', 'F9', 'F10', 'F11', 'F12']]
-    left_pipette.transfer(transfer_vol, source_plate['A3'], sulfonyl_dest_9, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['A3'], sulfonyl_dest_9, new_tip='once', disposal_volume=2)
     
     # Step 10: SulfonylCl 10 to G01-G08
-    sulfonyl_dest_10 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_10 = [dest_wells[well] for well in 
                         ['G1', 'G2', 'G3', 'G4', 'G5', 'G6', 'G7', 'G8']]
-    left_pipette.transfer(transfer_vol, source_plate['B3'], sulfonyl_dest_10, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['B3'], sulfonyl_dest_10, new_tip='once', disposal_volume=2)
     
     # Step 11: SulfonylCl 11 to G09-H04
-    sulfonyl_dest_11 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_11 = [dest_wells[well] for well in 
                         ['G9', 'G10', 'G11', 'G12', 'H1', 'H2', 'H3', 'H4']]
-    left_pipette.transfer(transfer_vol, source_plate['C3'], sulfonyl_dest_11, new_tip='once')
+    left_pipette.distribute(transfer_vol, source_plate['C3'], sulfonyl_dest_11, new_tip='once', disposal_volume=2)
     
     # Step 12: SulfonylCl 12 to H05-H12
-    sulfonyl_dest_12 = [dest_plate.wells_by_name()[well] for well in 
+    sulfonyl_dest_12 = [dest_wells[well] for well in 
                         ['H5', 'H6', 'H7', 'H8', 'H9', 'H10', 'H11', 'H12']]
-    left_pipette.transfer(transfer_vol, source_plate['D3'], sulfonyl_dest_12, new_tip='once')
-    
-    # Step 13-20: Transfer Amine compounds to destination plate
-    # Step 13: Amine 1
-    amine_dest_1 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A8', 'B4', 'B12', 'C8', 'D4', 'D12', 'E8', 'F4', 'F12', 'G8', 'H4', 'H12']]
-    left_pipette.transfer(transfer_vol, source_plate['A1'], amine_dest_1, new_tip='always')
-    
-    # Step 14: Amine 2
-    amine_dest_2 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A7', 'B3', 'B11', 'C7', 'D3', 'D11', 'E7', 'F3', 'F11', 'G7', 'H3', 'H11']]
-    left_pipette.transfer(transfer_vol, source_plate['B1'], amine_dest_2, new_tip='always')
-    
-    # Step 15: Amine 3
-    amine_dest_3 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A6', 'B2', 'B10', 'C6', 'D2', 'D10', 'E6', 'F2', 'F10', 'G6', 'H2', 'H10']]
-    left_pipette.transfer(transfer_vol, source_plate['C1'], amine_dest_3, new_tip='always')
-    
-    # Step 16: Amine 4
-    amine_dest_4 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A5', 'B1', 'B9', 'C5', 'D1', 'D9', 'E5', 'F1', 'F9', 'G5', 'H1', 'H9']]
-    left_pipette.transfer(transfer_vol, source_plate['D1'], amine_dest_4, new_tip='always')
-    
-    # Step 17: Amine 5
-    amine_dest_5 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A4', 'A12', 'B8', 'C4', 'C12', 'D8', 'E4', 'E12', 'F8', 'G4', 'G12', 'H8']]
-    left_pipette.transfer(transfer_vol, source_plate['E1'], amine_dest_5, new_tip='always')
-    
-    # Step 18: Amine 6
-    amine_dest_6 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A3', 'A11', 'B7', 'C3', 'C11', 'D7', 'E3', 'E11', 'F7', 'G3', 'G11', 'H7']]
-    left_pipette.transfer(transfer_vol, source_plate['F1'], amine_dest_6, new_tip='always')
-    
-    # Step 19: Amine 7
-    amine_dest_7 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A2', 'A10', 'B6', 'C2', 'C10', 'D6', 'E2', 'E10', 'F6', 'G2', 'G10', 'H6']]
-    left_pipette.transfer(transfer_vol, source_plate['G1'], amine_dest_7, new_tip='always')
-    
-    # Step 20: Amine 8
-    amine_dest_8 = [dest_plate.wells_by_name()[well] for well in 
-                    ['A1', 'A9', 'B5', 'C1', 'C9', 'D5', 'E1', 'E9', 'F5', 'G1', 'G9', 'H5']]
-    left_pipette.transfer(transfer_vol, source_plate['H1'], amine_dest_8, new_tip='always')
\ No newline at end of file
+    left_pipette.distribute(transfer_vol, source_plate['D3'], sulfonyl_dest_12, new_tip='once', disposal_volume=2)
+    
+    # Step 13-24: Transfer amines column-wise with the 8-channel pipette
+    # (one aspiration per destination column instead of one per well)
+    # Step 13: amine pattern column 4 to destination column 1
+    right_pipette.transfer(transfer_vol, source_plate['A4'], dest_plate['A1'], new_tip='always')
+
+    # Step 14: amine pattern column 5 to destination column 2
+    right_pipette.transfer(transfer_vol, source_plate['A5'], dest_plate['A2'], new_tip='always')
+
+    # Step 15: amine pattern column 6 to destination column 3
+    right_pipette.transfer(transfer_vol, source_plate['A6'], dest_plate['A3'], new_tip='always')
+
+    # Step 16: amine pattern column 7 to destination column 4
+    right_pipette.transfer(transfer_vol, source_plate['A7'], dest_plate['A4'], new_tip='always')
+
+    # Step 17: amine pattern column 8 to destination column 5
+    right_pipette.transfer(transfer_vol, source_plate['A8'], dest_plate['A5'], new_tip='always')
+
+    # Step 18: amine pattern column 9 to destination column 6
+    right_pipette.transfer(transfer_vol, source_plate['A9'], dest_plate['A6'], new_tip='always')
+
+    # Step 19: amine pattern column 10 to destination column 7
+    right_pipette.transfer(transfer_vol, source_plate['A10'], dest_plate['A7'], new_tip='always')
+
+    # Step 20: amine pattern column 11 to destination column 8
+    right_pipette.transfer(transfer_vol, source_plate['A11'], dest_plate['A8'], new_tip='always')
+
+    # Step 21: amine pattern column 4 to destination column 9
+    right_pipette.transfer(transfer_vol, source_plate['A4'], dest_plate['A9'], new_tip='always')
+
+    # Step 22: amine pattern column 5 to destination column 10
+    right_pipette.transfer(transfer_vol, source_plate['A5'], dest_plate['A10'], new_tip='always')
+
+    # Step 23: amine pattern column 6 to destination column 11
+    right_pipette.transfer(transfer_vol, source_plate['A6'], dest_plate['A11'], new_tip='always')
+
+    # Step 24: amine pattern column 7 to destination column 12
+    right_pipette.transfer(transfer_vol, source_plate['A7'], dest_plate['A12'], new_tip='always')
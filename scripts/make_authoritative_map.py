@@ -9,9 +9,12 @@ Outputs:
 Assumptions (matches your protocol):
 - liquids defined via protocol.define_liquid(name="Amine 1" / "SulfonylCl 1" etc.)
 - loaded into source_plate['A1'].load_liquid(liquid=amine_1, volume=50)
-- transfers via left_pipette.transfer(..., source_plate['A2'], sulfonyl_dest_1, ...)
+- transfers via left_pipette.transfer/.distribute(..., source_plate['A2'], sulfonyl_dest_1, ...)
 - destination well lists defined as list comps, e.g.
     sulfonyl_dest_1 = [dest_plate.wells_by_name()[well] for well in ['A1','A2',...]]
+- 8-channel transfers address the top (row A) well of a column on both sides, e.g.
+    right_pipette.transfer(..., source_plate['A4'], dest_plate['A1'], ...)
+  and are expanded row-by-row (A4->A1, B4->B1, ... H4->H1).
 """
 
 from __future__ import annotations
@@ -72,13 +75,22 @@ def parse_protocol(protocol_path: Path) -> Tuple[List[Dict], List[Dict]]:
     if run_node is None:
         raise ValueError("Could not find run(protocol) function in protocol.")
 
-    # 1) reagent variables -> (class, num, name)
+    # 1) reagent variables -> (class, num, name); pipette variables -> channel count
     reagent_vars: Dict[str, Dict] = {}
+    pipette_channels: Dict[str, int] = {}
     for stmt in run_node.body:
         if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
             var = stmt.targets[0].id
             call = stmt.value
-            if isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute) and call.func.attr == "define_liquid":
+            if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)):
+                continue
+
+            if call.func.attr == "load_instrument":
+                iname = _const_str(call.args[0]) if call.args else None
+                if iname:
+                    pipette_channels[var] = 8 if "8channel" in iname else 1
+
+            elif call.func.attr == "define_liquid":
                 name = None
                 for kw in call.keywords:
                     if kw.arg == "name":
@@ -132,12 +144,12 @@ def parse_protocol(protocol_path: Path) -> Tuple[List[Dict], List[Dict]]:
                     if wells:
                         dest_lists[var] = wells
 
-    # 4) transfer calls: left_pipette.transfer(vol, source_plate['A2'], sulfonyl_dest_1, ...)
+    # 4) transfer calls: left_pipette.transfer/.distribute(vol, source_plate['A2'], sulfonyl_dest_1, ...)
     transfers = []
     for stmt in run_node.body:
         if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
             call = stmt.value
-            if isinstance(call.func, ast.Attribute) and call.func.attr == "transfer":
+            if isinstance(call.func, ast.Attribute) and call.func.attr in ("transfer", "distribute"):
                 args = call.args
                 if len(args) < 3:
                     continue
@@ -146,14 +158,32 @@ def parse_protocol(protocol_path: Path) -> Tuple[List[Dict], List[Dict]]:
                 if base != "source_plate" or not src_well:
                     continue
 
+                pipette = call.func.value
+                channels = pipette_channels.get(pipette.id, 1) if isinstance(pipette, ast.Name) else 1
+
                 dest_arg = args[2]
                 dest_wells = None
                 if isinstance(dest_arg, ast.Name) and dest_arg.id in dest_lists:
                     dest_wells = dest_lists[dest_arg.id]
                 elif isinstance(dest_arg, ast.List):
                     dest_wells = [s for s in (_const_str(e) for e in dest_arg.elts) if s]
+                elif isinstance(dest_arg, ast.Subscript):
+                    dbase, dwell = _subscript_well(dest_arg)
+                    if dbase == "dest_plate" and dwell:
+                        dest_wells = [dwell]
+
+                if not dest_wells:
+                    continue
 
-                if dest_wells:
+                if channels == 8:
+                    # 8-channel: both sides address the top well of a column;
+                    # expand into one row-paired transfer per channel.
+                    src_col = src_well[1:]
+                    for dw in dest_wells:
+                        dest_col = dw[1:]
+                        for r in "ABCDEFGH":
+                            transfers.append({"src_well": f"{r}{src_col}", "dest_wells": [f"{r}{dest_col}"]})
+                else:
                     transfers.append({"src_well": src_well, "dest_wells": dest_wells})
 
     # Build destination map: well -> sulfonyl#/amine# and source wells
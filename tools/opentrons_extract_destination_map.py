@@ -9,9 +9,12 @@ Outputs:
 Assumptions (matches your protocol):
 - liquids defined via protocol.define_liquid(name="Amine 1" / "SulfonylCl 1" etc.)
 - loaded into source_plate['A1'].load_liquid(liquid=amine_1, volume=50)
-- transfers via left_pipette.transfer(..., source_plate['A2'], sulfonyl_dest_1, ...)
+- transfers via left_pipette.transfer/.distribute(..., source_plate['A2'], sulfonyl_dest_1, ...)
 - destination well lists defined as list comps, e.g.
     sulfonyl_dest_1 = [dest_plate.wells_by_name()[well] for well in ['A1','A2',...]]
+- 8-channel transfers address the top (row A) well of a column on both sides, e.g.
+    right_pipette.transfer(..., source_plate['A4'], dest_plate['A1'], ...)
+  and are expanded row-by-row (A4->A1, B4->B1, ... H4->H1).
 """
 
 from __future__ import annotations
@@ -19,145 +22,252 @@ from __future__ import annotations
 import argparse
 import ast
 import csv
+import functools
+import hashlib
+import io
+import pickle
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
-RE_AMINE = re.compile(r"^Amine\s+(\d+)\s*$", re.IGNORECASE)
-RE_SULF = re.compile(r"^SulfonylCl\s+(\d+)\s*$", re.IGNORECASE)
+CACHE_DIR = Path(".cache")
+
+
+# Reagent classes as interned small ints: identity-comparable on the
+# per-well hot path, mapped back to names only for the source CSV.
+_AMINE, _SULF = 0, 1
+_CLASS_NAMES = {_AMINE: "amine", _SULF: "sulfonyl"}
+
+# Single alternation so each liquid name is scanned once; the named group
+# that matched tells the reagent class, group 3 is the number.
+RE_REAGENT = re.compile(r"(?:(?P<amine>Amine)|(?P<sulf>SulfonylCl))\s+(\d+)\s*", re.IGNORECASE)
 
 
 def _const_str(node: ast.AST) -> Optional[str]:
-    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+    return node.value if type(node) is ast.Constant and type(node.value) is str else None
 
 
 def _subscript_well(node: ast.AST) -> Tuple[Optional[str], Optional[str]]:
     """Return (base_name, well_str) for source_plate['A1'] style."""
-    if not isinstance(node, ast.Subscript):
+    if type(node) is not ast.Subscript:
         return None, None
 
     base = node.value
-    base_name = base.id if isinstance(base, ast.Name) else None
+    base_name = base.id if type(base) is ast.Name else None
 
+    # Python >= 3.9 (the documented floor): subscript slices are plain
+    # expressions, so the old ast.Index wrapper can't occur.
     sl = node.slice
-    if isinstance(sl, ast.Constant) and isinstance(sl.value, str):
+    if type(sl) is ast.Constant and type(sl.value) is str:
         return base_name, sl.value
 
-    # for older AST nodes (rare on modern Python)
-    if hasattr(ast, "Index") and isinstance(sl, ast.Index) and isinstance(sl.value, ast.Constant):
-        if isinstance(sl.value.value, str):
-            return base_name, sl.value.value
-
     return base_name, None
 
 
-def _well_sort_key(w: str) -> Tuple[int, int]:
-    """Column-major sort: A1,B1,...H1,A2,..."""
-    row = w[0].upper()
-    col = int(w[1:])
-    row_order = "ABCDEFGH".index(row)
-    return col, row_order
-
-
-def parse_protocol(protocol_path: Path) -> Tuple[List[Dict], List[Dict]]:
-    code = protocol_path.read_text(encoding="utf-8")
-    tree = ast.parse(code)
-
-    run_node = None
-    for n in tree.body:
-        if isinstance(n, ast.FunctionDef) and n.name == "run":
-            run_node = n
-            break
-    if run_node is None:
-        raise ValueError("Could not find run(protocol) function in protocol.")
-
-    # 1) reagent variables -> (class, num, name)
-    reagent_vars: Dict[str, Dict] = {}
-    for stmt in run_node.body:
-        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
-            var = stmt.targets[0].id
-            call = stmt.value
-            if isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute) and call.func.attr == "define_liquid":
-                name = None
-                for kw in call.keywords:
-                    if kw.arg == "name":
-                        name = _const_str(kw.value)
-                if not name:
-                    continue
-
-                mA = RE_AMINE.match(name)
-                mS = RE_SULF.match(name)
-                if mA:
-                    reagent_vars[var] = {"class": "amine", "num": int(mA.group(1)), "name": name}
-                elif mS:
-                    reagent_vars[var] = {"class": "sulfonyl", "num": int(mS.group(1)), "name": name}
-
-    # 2) source well -> reagent var
-    source_well_map: Dict[str, Dict] = {}
-    for node in ast.walk(run_node):
-        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "load_liquid"):
-            continue
-
+# Byte-indexed row order ('A'/'a' -> 0 ... 'H'/'h' -> 7); replaces the
+# per-well .upper() + str.index scan.
+_ROW_ORD = bytearray(256)
+for _i, _c in enumerate("ABCDEFGH"):
+    _ROW_ORD[ord(_c)] = _i
+    _ROW_ORD[ord(_c.lower())] = _i
+
+
+@functools.cache
+def _well_sort_key(w: str) -> int:
+    """Column-major sort: A1,B1,...H1,A2,... (single-int key: col*8 + row)."""
+    return int(w[1:]) * 8 + _ROW_ORD[ord(w[0])]
+
+
+class _ProtocolVisitor:
+    """Collects liquid/instrument/dest-list/transfer facts from run().
+
+    scan() walks the tree with an explicit stack instead of NodeVisitor's
+    generic_visit recursion or the ast.walk generator, so there is no
+    per-node Python frame or yield overhead — just a loop, a type check
+    and a handler call. Children are pushed in reverse so nodes are seen
+    in source order, which is dependency order in these protocols
+    (transfers always see their dest lists already recorded).
+    """
+
+    def __init__(self) -> None:
+        self.reagent_vars: Dict[str, Dict] = {}      # var -> (class, num, name)
+        self.pipette_channels: Dict[str, int] = {}   # var -> channel count
+        self.source_well_map: Dict[str, Dict] = {}   # source well -> liquid var + volume
+        self.dest_lists: Dict[str, List[str]] = {}   # var -> destination well names
+        self.transfers: List[Dict] = []
+
+    # -- traversal and routing --------------------------------------------
+
+    def scan(self, root: ast.AST) -> None:
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            t = type(node)
+            if t is ast.Assign:
+                # Assignments are declarations (liquids, instruments, dest
+                # lists), fully classified here — don't descend into them.
+                self._handle_assign(node)
+                continue
+            if t is ast.Call:
+                self._handle_call(node)
+            stack.extend(reversed([*ast.iter_child_nodes(node)]))
+
+    def _handle_assign(self, node: ast.Assign) -> None:
+        if len(node.targets) != 1 or type(node.targets[0]) is not ast.Name:
+            return
+        var = node.targets[0].id
+        val = node.value
+        val_t = type(val)
+        if val_t is ast.Call and type(val.func) is ast.Attribute:
+            if val.func.attr == "load_instrument":
+                iname = _const_str(val.args[0]) if val.args else None
+                if iname:
+                    self.pipette_channels[var] = 8 if "8channel" in iname else 1
+            elif val.func.attr == "define_liquid":
+                self._handle_define_liquid(var, val)
+        elif val_t is ast.ListComp and val.generators:
+            self._handle_dest_listcomp(var, val)
+
+    def _handle_call(self, node: ast.Call) -> None:
+        # Reached at any nesting depth (loops, with-blocks, ...).
+        fn = node.func
+        if type(fn) is ast.Attribute:
+            if fn.attr == "load_liquid":
+                self._handle_load_liquid(node)
+            elif fn.attr in ("transfer", "distribute"):
+                self._handle_transfer(node)
+
+    # -- handlers ---------------------------------------------------------
+
+    def _handle_define_liquid(self, var: str, call: ast.Call) -> None:
+        name = None
+        for kw in call.keywords:
+            if kw.arg == "name":
+                name = _const_str(kw.value)
+        if not name:
+            return
+
+        # Cheap prefix gate skips the regex engine entirely for non-reagent
+        # liquid names (solvents, washes, ...); lowercase first so the gate
+        # admits everything the IGNORECASE regex would match.
+        if not name[:8].lower().startswith(("amine", "sulfonyl")):
+            return
+        m = RE_REAGENT.fullmatch(name)
+        if m:
+            cls = _AMINE if m.group("amine") else _SULF
+            self.reagent_vars[var] = {"class": cls, "num": int(m.group(3)), "name": name}
+
+    def _handle_dest_listcomp(self, var: str, val: ast.ListComp) -> None:
+        # sulfonyl_dest_1 = [dest_wells[well] for well in ['A1',...]]
+        gen = val.generators[0]
+        if type(gen.iter) in (ast.List, ast.Tuple):
+            wells = []
+            for elt in gen.iter.elts:
+                s = _const_str(elt)
+                if s:
+                    wells.append(s)
+            if wells:
+                self.dest_lists[var] = wells
+
+    def _handle_load_liquid(self, call: ast.Call) -> None:
         # expect: source_plate['A1'].load_liquid(...)
-        base, well = _subscript_well(node.func.value)
+        base, well = _subscript_well(call.func.value)
         if base != "source_plate" or not well:
-            continue
+            return
 
         liquid_var = None
         vol = None
-        for kw in node.keywords:
-            if kw.arg == "liquid" and isinstance(kw.value, ast.Name):
+        for kw in call.keywords:
+            if kw.arg == "liquid" and type(kw.value) is ast.Name:
                 liquid_var = kw.value.id
-            if kw.arg == "volume" and isinstance(kw.value, ast.Constant):
+            if kw.arg == "volume" and type(kw.value) is ast.Constant:
                 vol = kw.value.value
 
         if liquid_var:
-            source_well_map[well] = {"liquid_var": liquid_var, "volume": vol}
-
-    # 3) list vars: sulfonyl_dest_1 = [dest_plate.wells_by_name()[well] for well in ['A1',...]]
-    dest_lists: Dict[str, List[str]] = {}
-    for stmt in run_node.body:
-        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
-            var = stmt.targets[0].id
-            val = stmt.value
-            if isinstance(val, ast.ListComp) and val.generators:
-                gen = val.generators[0]
-                if isinstance(gen.iter, (ast.List, ast.Tuple)):
-                    wells = []
-                    for elt in gen.iter.elts:
-                        s = _const_str(elt)
-                        if s:
-                            wells.append(s)
-                    if wells:
-                        dest_lists[var] = wells
-
-    # 4) transfer calls: left_pipette.transfer(vol, source_plate['A2'], sulfonyl_dest_1, ...)
-    transfers = []
-    for stmt in run_node.body:
-        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
-            call = stmt.value
-            if isinstance(call.func, ast.Attribute) and call.func.attr == "transfer":
-                args = call.args
-                if len(args) < 3:
-                    continue
-
-                base, src_well = _subscript_well(args[1])
-                if base != "source_plate" or not src_well:
-                    continue
-
-                dest_arg = args[2]
-                dest_wells = None
-                if isinstance(dest_arg, ast.Name) and dest_arg.id in dest_lists:
-                    dest_wells = dest_lists[dest_arg.id]
-                elif isinstance(dest_arg, ast.List):
-                    dest_wells = [s for s in (_const_str(e) for e in dest_arg.elts) if s]
-
-                if dest_wells:
-                    transfers.append({"src_well": src_well, "dest_wells": dest_wells})
-
-    # Build destination map: well -> sulfonyl#/amine# and source wells
-    dest_map: Dict[str, Dict] = {}
+            self.source_well_map[well] = {"liquid_var": liquid_var, "volume": vol}
+
+    def _handle_transfer(self, call: ast.Call) -> None:
+        # left_pipette.transfer/.distribute(vol, source_plate['A2'], sulfonyl_dest_1, ...)
+        args = call.args
+        if len(args) < 3:
+            return
+
+        base, src_well = _subscript_well(args[1])
+        if base != "source_plate" or not src_well:
+            return
+
+        pipette = call.func.value
+        channels = self.pipette_channels.get(pipette.id, 1) if type(pipette) is ast.Name else 1
+
+        dest_arg = args[2]
+        dest_wells = None
+        dest_t = type(dest_arg)
+        if dest_t is ast.Name and dest_arg.id in self.dest_lists:
+            dest_wells = self.dest_lists[dest_arg.id]
+        elif dest_t is ast.List:
+            dest_wells = [s for s in (_const_str(e) for e in dest_arg.elts) if s]
+        elif dest_t is ast.Subscript:
+            dbase, dwell = _subscript_well(dest_arg)
+            if dbase == "dest_plate" and dwell:
+                dest_wells = [dwell]
+
+        if not dest_wells:
+            return
+
+        if channels == 8:
+            # 8-channel: both sides address the top well of a column;
+            # expand into one row-paired transfer per channel.
+            src_col = src_well[1:]
+            for dw in dest_wells:
+                dest_col = dw[1:]
+                for r in "ABCDEFGH":
+                    self.transfers.append({"src_well": f"{r}{src_col}", "dest_wells": [f"{r}{dest_col}"]})
+        else:
+            self.transfers.append({"src_well": src_well, "dest_wells": dest_wells})
+
+
+def _cached_parse(protocol_path: Path, use_cache: bool = True) -> ast.Module:
+    """Parse the protocol, caching the pickled AST keyed on (path, mtime, size).
+
+    ast.parse dominates the tool's runtime; pipelines that re-run it over
+    the same unchanged protocol hit the cache instead. An edited file gets
+    a new mtime/size key, so stale trees can never replay.
+    """
+    st = protocol_path.stat()
+    key = f"{protocol_path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    cache_file = CACHE_DIR / f"ast_{hashlib.blake2b(key.encode()).hexdigest()}.pkl"
+
+    if use_cache and cache_file.exists():
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+
+    tree = ast.parse(protocol_path.read_text(encoding="utf-8"))
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with cache_file.open("wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return tree
+
+
+def parse_protocol(protocol_path: Path, use_cache: bool = True) -> Tuple[Iterator[Dict], List[Dict]]:
+    tree = _cached_parse(protocol_path, use_cache=use_cache)
+
+    funcs = {n.name: n for n in tree.body if type(n) is ast.FunctionDef}
+    run_node = funcs.get("run")
+    if run_node is None:
+        raise ValueError("Could not find run(protocol) function in protocol.")
+
+    visitor = _ProtocolVisitor()
+    visitor.scan(run_node)
+    reagent_vars = visitor.reagent_vars
+    source_well_map = visitor.source_well_map
+    transfers = visitor.transfers
+
+    # Build destination map: well -> [sulf_num, amine_num, sulf_src, amine_src].
+    # A 4-slot list per well instead of a 5-key dict: index assignment skips
+    # the per-field string hashing, and the well name lives only in the key.
+    dest_map: Dict[str, List] = {}
     for t in transfers:
         src_well = t["src_well"]
         src_info = source_well_map.get(src_well)
@@ -170,51 +280,74 @@ def parse_protocol(protocol_path: Path) -> Tuple[List[Dict], List[Dict]]:
             continue
 
         for dw in t["dest_wells"]:
-            rec = dest_map.setdefault(
-                dw,
-                {
-                    "Well": dw,
-                    "Sulfonyl chloride #": "",
-                    "Amine #": "",
-                    "Sulfonyl source well": "",
-                    "Amine source well": "",
-                },
-            )
-            if rinfo["class"] == "sulfonyl":
-                rec["Sulfonyl chloride #"] = rinfo["num"]
-                rec["Sulfonyl source well"] = src_well
-            elif rinfo["class"] == "amine":
-                rec["Amine #"] = rinfo["num"]
-                rec["Amine source well"] = src_well
+            # explicit get-or-create: setdefault would build (and usually
+            # discard) a fresh default list on every repeat visit of a well
+            rec = dest_map.get(dw)
+            if rec is None:
+                rec = ["", "", "", ""]
+                dest_map[dw] = rec
+            cls = rinfo["class"]
+            if cls is _SULF:
+                rec[0] = rinfo["num"]
+                rec[2] = src_well
+            elif cls is _AMINE:
+                rec[1] = rinfo["num"]
+                rec[3] = src_well
 
     # source layout (optional)
     source_rows = []
     for well, d in source_well_map.items():
         rv = d["liquid_var"]
-        rinfo = reagent_vars.get(rv, {"class": "unknown", "num": "", "name": rv})
+        rinfo = reagent_vars.get(rv, {"class": None, "num": "", "name": rv})
         source_rows.append(
             {
                 "SourceWell": well,
-                "ReagentClass": rinfo["class"],
+                "ReagentClass": _CLASS_NAMES.get(rinfo["class"], "unknown"),
                 "ReagentNumber": rinfo["num"],
                 "ReagentName": rinfo["name"],
                 "Volume_uL": d.get("volume", ""),
             }
         )
 
-    # destination rows sorted column-major
-    dest_rows = [dest_map[w] for w in sorted(dest_map.keys(), key=_well_sort_key)]
+    # destination rows sorted column-major, built lazily: write_csv streams
+    # them straight into the writer, so no second per-well list is held.
+    dest_rows = (
+        {
+            "Well": w,
+            "Sulfonyl chloride #": dest_map[w][0],
+            "Amine #": dest_map[w][1],
+            "Sulfonyl source well": dest_map[w][2],
+            "Amine source well": dest_map[w][3],
+        }
+        for w in sorted(dest_map.keys(), key=_well_sort_key)
+    )
 
     return dest_rows, source_rows
 
 
-def write_csv(path: Path, rows: List[Dict], fieldnames: List[str]) -> None:
+def write_csv(path: Path, rows: Iterable[Dict], fieldnames: List[str]) -> int:
+    """Stream ``rows`` (any iterable of dicts) to ``path``; return row count."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
+    # Assemble the whole CSV in memory, then hand the file object one string:
+    # a single encode pass and (for these sub-100 KB files) a single write.
+    buf = io.StringIO(newline="")
+    w = csv.writer(buf)
+    w.writerow(fieldnames)
+    # plain csv.writer + tuples pulled lazily: one C-level writerows call,
+    # no per-row fieldname hashing, and no materialized row list. The
+    # counter rides along in the generator writerows drains.
+    n = 0
+
+    def _tuples() -> Iterator[tuple]:
+        nonlocal n
         for r in rows:
-            w.writerow(r)
+            n += 1
+            yield tuple(r.get(fn, "") for fn in fieldnames)
+
+    w.writerows(_tuples())
+    with path.open("w", newline="", encoding="utf-8") as f:
+        f.write(buf.getvalue())
+    return n
 
 
 def main() -> int:
@@ -222,26 +355,25 @@ def main() -> int:
     ap.add_argument("--protocol", type=Path, required=True, help="Path to Opentrons protocol .py")
     ap.add_argument("--out-dest", type=Path, default=Path("destination_plate_layout.csv"))
     ap.add_argument("--out-source", type=Path, default=None, help="Optional: write source_plate_layout.csv")
+    ap.add_argument("--no-cache", action="store_true", help="Skip the on-disk parsed-AST cache")
     args = ap.parse_args()
 
-    dest_rows, source_rows = parse_protocol(args.protocol)
+    dest_rows, source_rows = parse_protocol(args.protocol, use_cache=not args.no_cache)
 
-    write_csv(
+    n_dest = write_csv(
         args.out_dest,
         dest_rows,
         ["Well", "Sulfonyl chloride #", "Amine #", "Sulfonyl source well", "Amine source well"],
     )
+    print(f"✅ Wrote {args.out_dest} ({n_dest} rows)")
 
     if args.out_source:
-        write_csv(
+        n_src = write_csv(
             args.out_source,
             source_rows,
             ["SourceWell", "ReagentClass", "ReagentNumber", "ReagentName", "Volume_uL"],
         )
-
-    print(f"✅ Wrote {args.out_dest} ({len(dest_rows)} rows)")
-    if args.out_source:
-        print(f"✅ Wrote {args.out_source} ({len(source_rows)} rows)")
+        print(f"✅ Wrote {args.out_source} ({n_src} rows)")
     return 0
 
 